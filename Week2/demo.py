@@ -4,8 +4,10 @@
 
 import sys
 
-# Common vulnerable ports
-VULNERABLE_PORTS = [21, 23, 25, 80, 443, 3389, 8080, 67]
+# Common vulnerable ports (frozenset for O(1) membership checks;
+# the tuple keeps a stable order for display)
+VULNERABLE_PORTS = frozenset({21, 23, 25, 80, 443, 3389, 8080, 67})
+VULNERABLE_PORTS_DISPLAY = (21, 23, 25, 80, 443, 3389, 8080, 67)
 
 # Check if argument provided
 if len(sys.argv) < 2:
@@ -13,7 +15,7 @@ if len(sys.argv) < 2:
     sys.exit(1)
 
 # Get port from arguments
-port = int(sys.argv[2])
+port = int(sys.argv[1])
 
 # Check the port
 if port in VULNERABLE_PORTS:
@@ -22,4 +24,4 @@ if port in VULNERABLE_PORTS:
 else:
     print(f"✓ Port {port} is not in common vulnerable port list.")
 
-print(f"\nVulnerable ports: {VULNERABLE_PORTS}")
\ No newline at end of file
+print(f"\nVulnerable ports: {list(VULNERABLE_PORTS_DISPLAY)}")
\ No newline at end of file
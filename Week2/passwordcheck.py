@@ -2,6 +2,54 @@
 # passwordcheck.py
 # Validates password strength based on security requirements
 
+# numba is optional: when present, the character scan below compiles
+# to native code for bulk credential validation
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Allowed special characters (frozenset gives O(1) membership checks)
+SPECIAL_CHARS = frozenset("!@#$%^&*()_+-=[]{}|;:,.<>?")
+
+# Character-class bit flags
+HAS_LOWER = 1
+HAS_UPPER = 2
+HAS_DIGIT = 4
+HAS_SPECIAL = 8
+
+# The special set packed into two 64-bit masks covering ASCII 0-127,
+# so the scanner tests membership with one shift instead of a hash probe
+_SPECIAL_MASK_LO = 0
+_SPECIAL_MASK_HI = 0
+for _c in SPECIAL_CHARS:
+    _code = ord(_c)
+    if _code < 64:
+        _SPECIAL_MASK_LO |= 1 << _code
+    elif _code < 128:
+        _SPECIAL_MASK_HI |= 1 << (_code - 64)
+
+def _classify_bytes(buf):
+    """Single pass over UTF-8 bytes, OR-ing class-presence flags."""
+    flags = 0
+    for b in buf:
+        if 97 <= b <= 122:          # a-z
+            flags |= 1
+        elif 65 <= b <= 90:         # A-Z
+            flags |= 2
+        elif 48 <= b <= 57:         # 0-9
+            flags |= 4
+        elif b < 64:
+            if _SPECIAL_MASK_LO >> b & 1:
+                flags |= 8
+        elif b < 128:
+            if _SPECIAL_MASK_HI >> (b - 64) & 1:
+                flags |= 8
+    return flags
+
+if njit is not None:
+    _classify_bytes = njit(cache=True)(_classify_bytes)
+
 def check_password_strength(password):
     """
     Checks password against security requirements.
@@ -13,21 +61,20 @@ def check_password_strength(password):
     if len(password) < 8:
         issues.append("❌ Password must be at least 8 characters")
 
-    # Check for lowercase
-    if not any(c.islower() for c in password):
+    # Scan the encoded password once; with numba installed this runs as
+    # a compiled native loop
+    flags = _classify_bytes(password.encode('utf-8'))
+
+    if not flags & HAS_LOWER:
         issues.append("❌ Password must contain lowercase letters")
 
-    # Check for uppercase
-    if not any(c.isupper() for c in password):
+    if not flags & HAS_UPPER:
         issues.append("❌ Password must contain uppercase letters")
 
-    # Check for digits
-    if not any(c.isdigit() for c in password):
+    if not flags & HAS_DIGIT:
         issues.append("❌ Password must contain numbers")
 
-    # Check for special characters
-    special_chars = "!@#$%^&*()_+-=[]{}|;:,.<>?"
-    if not any(c in special_chars for c in password):
+    if not flags & HAS_SPECIAL:
         issues.append("❌ Password must contain special characters")
 
     is_strong = len(issues) == 0
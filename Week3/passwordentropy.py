@@ -3,16 +3,47 @@
 
 import math
 
+# Character-class bit flags
+HAS_LOWER = 1
+HAS_UPPER = 2
+HAS_DIGIT = 4
+HAS_SPECIAL = 8
+
+special_chars = frozenset("!@#$%^&*()_+-=[]{}|;:,.<>?")
+
+def _classify(code):
+    """Map a character code to its class bit (0 if unclassified)."""
+    c = chr(code)
+    if c.islower():
+        return HAS_LOWER
+    if c.isupper():
+        return HAS_UPPER
+    if c.isdigit():
+        return HAS_DIGIT
+    if c in special_chars:
+        return HAS_SPECIAL
+    return 0
+
+# 256-entry lookup table: byte value -> class bit, built once at import
+CLASS_TABLE = bytes(_classify(code) for code in range(256))
+
 print("=== Password Entropy Calculator ===")
 print("Entropy measures password unpredictability in bits\n")
 
 password = input("Enter password to analyze: ")
 
-# Determine character pool size
-has_lowercase = any(c.islower() for c in password)
-has_uppercase = any(c.isupper() for c in password)
-has_digits = any(c.isdigit() for c in password)
-has_special = any(c in "!@#$%^&*()_+-=[]{}|;:,.<>?" for c in password)
+# Determine character pool size: one pass over the password, OR-ing
+# class bits from the table instead of four separate any(...) scans.
+# Characters outside Latin-1 are dropped from the scan so they
+# contribute no class bit, matching the per-class checks.
+mask = 0
+for byte in password.encode('latin-1', 'ignore'):
+    mask |= CLASS_TABLE[byte]
+
+has_lowercase = bool(mask & HAS_LOWER)
+has_uppercase = bool(mask & HAS_UPPER)
+has_digits = bool(mask & HAS_DIGIT)
+has_special = bool(mask & HAS_SPECIAL)
 
 pool_size = 0
 if has_lowercase:
@@ -26,6 +26,41 @@ This is a simplified estimate. Real-world password entropy can be lower if:
 
 import math  # Provides log base 2 via math.log2
 
+# ---- Character Classification Table ----
+# Instead of scanning the password once per character class (four passes
+# with a Python-level predicate call per character), we classify each
+# character through a 256-entry lookup table built once at import time.
+# Each table entry holds a bit flag identifying the character's class.
+
+# Bit flags for the four character classes we recognize.
+HAS_LOWER = 1
+HAS_UPPER = 2
+HAS_DIGIT = 4
+HAS_SPECIAL = 8
+
+# Special characters: a curated set of common symbols, held in a
+# frozenset so each membership test is an O(1) hash lookup rather than
+# a linear scan of a string literal.
+# NOTE: This is not exhaustive. Different systems may allow more or fewer.
+# If your environment allows a larger set, you can expand the literal.
+special_chars = frozenset("!@#$%^&*()_+-=[]{}|;:,.<>?")
+
+def _classify(code):
+    """Map a character code (0-255) to its class bit, or 0 if none."""
+    c = chr(code)
+    if c.islower():
+        return HAS_LOWER
+    if c.isupper():
+        return HAS_UPPER
+    if c.isdigit():
+        return HAS_DIGIT
+    if c in special_chars:
+        return HAS_SPECIAL
+    return 0
+
+# The finished table: index by byte value, get the class bit.
+CLASS_TABLE = bytes(_classify(code) for code in range(256))
+
 # ---- User Interface Header ----
 # Print a title and a short explanation to orient the user before input.
 print("=== Password Entropy Calculator ===")
@@ -40,21 +75,25 @@ password = input("Enter password to analyze: ")
 # ---- Feature Detection: Character Classes Present ----
 # We determine which character classes are present in the password.
 # This affects the assumed 'character pool size' R in the entropy formula.
+# One pass over the password: OR together the class bits of every
+# character. After the loop, each bit in 'mask' answers one of the four
+# "does the password contain ...?" questions. Characters outside
+# Latin-1 are dropped from the scan so they contribute no class bit.
+mask = 0
+for byte in password.encode('latin-1', 'ignore'):
+    mask |= CLASS_TABLE[byte]
 
 # 1) Lowercase letters: 'a' to 'z'
-has_lowercase = any(c.islower() for c in password)
+has_lowercase = bool(mask & HAS_LOWER)
 
 # 2) Uppercase letters: 'A' to 'Z'
-has_uppercase = any(c.isupper() for c in password)
+has_uppercase = bool(mask & HAS_UPPER)
 
 # 3) Digits: '0' to '9'
-has_digits = any(c.isdigit() for c in password)
+has_digits = bool(mask & HAS_DIGIT)
 
-# 4) Special characters: a curated set of common symbols
-#    NOTE: This is not exhaustive. Different systems may allow more or fewer.
-#    If your environment allows a larger set, you can expand this string.
-special_chars = "!@#$%^&*()_+-=[]{}|;:,.<>?"  # Use literal characters in code
-has_special = any(c in special_chars for c in password)
+# 4) Special characters (see the curated set above)
+has_special = bool(mask & HAS_SPECIAL)
 
 # ---- Compute Effective Character Pool Size (R) ----
 # Start from zero and add the size contribution for each detected class.
@@ -124,4 +163,3 @@ else:
         strength = "VERY STRONG - Crackable in centuries"
 
     print(f"Strength: {strength}")
-``
@@ -62,7 +62,7 @@ print("Converting memory addresses to decimal:")
 
 for addr in memory_addresses:
     decimal = hex_to_decimal(addr)
-    binary = bin(decimal)[2:].zfill(16)  # Show binary too
+    binary = f"{decimal:016b}"  # Show binary too (single C-level format)
     print(f"0x{addr}  =  {decimal:>5} decimal  =  {binary} binary")
 
 # Test Case 3: Reverse conversion (decimal to hex)
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# subnet_calulator.py
+# Calculates subnet details from a network in CIDR notation
+
+import functools
+import ipaddress
+from typing import NamedTuple
+
+
+class SubnetInfo(NamedTuple):
+    """
+    Subnet facts stored as plain integers.
+
+    Keeping the addresses numeric avoids paying for a dozen dotted-quad
+    string conversions per calculation; callers that want display text
+    ask for it explicitly via as_strings().
+    """
+    network_int: int
+    broadcast_int: int
+    netmask_int: int
+    wildcard_int: int
+    prefixlen: int
+    num_addresses: int
+    usable_hosts: int
+    ip_class: str
+
+    def as_strings(self):
+        """Format the numeric fields into a display-ready dict."""
+        # Only networks bigger than a /31 exclude the network and
+        # broadcast addresses; for /31 and /32 every address is usable
+        if self.num_addresses > 2:
+            first_usable = self.network_int + 1
+            last_usable = self.broadcast_int - 1
+        else:
+            first_usable = self.network_int
+            last_usable = self.broadcast_int
+        return {
+            'network': f"{_fmt(self.network_int)}/{self.prefixlen}",
+            'netmask': _fmt(self.netmask_int),
+            'wildcard': _fmt(self.wildcard_int),
+            'broadcast': _fmt(self.broadcast_int),
+            'first_usable': _fmt(first_usable),
+            'last_usable': _fmt(last_usable),
+            'total_addresses': str(self.num_addresses),
+            'usable_hosts': str(self.usable_hosts),
+            'class': self.ip_class,
+        }
+
+
+def _fmt(address_int):
+    """Convert a 32-bit integer to dotted-quad notation."""
+    return str(ipaddress.IPv4Address(address_int))
+
+
+def classify_network(net):
+    """Return the classful network letter (A-E) for an IPv4 network."""
+    # Top octet straight off the integer form - no format-then-reparse
+    first_octet = int(net.network_address) >> 24
+
+    if first_octet < 128:
+        return 'A'
+    elif first_octet < 192:
+        return 'B'
+    elif first_octet < 224:
+        return 'C'
+    elif first_octet < 240:
+        return 'D (multicast)'
+    else:
+        return 'E (experimental)'
+
+
+@functools.lru_cache(maxsize=1024)
+def _subnet_info(cidr):
+    """
+    Build the SubnetInfo for a CIDR string, raising ValueError on
+    invalid input.
+
+    Pure function, so caching is safe: repeated queries for the same
+    network - common when walking logs - skip the ipaddress parsing
+    entirely, and the SubnetInfo result is an immutable tuple that can
+    be shared between callers.
+    """
+    net = ipaddress.ip_network(cidr, strict=False)
+
+    usable = net.num_addresses - 2 if net.num_addresses > 2 else net.num_addresses
+
+    return SubnetInfo(
+        network_int=int(net.network_address),
+        broadcast_int=int(net.broadcast_address),
+        netmask_int=int(net.netmask),
+        wildcard_int=int(net.hostmask),
+        prefixlen=net.prefixlen,
+        num_addresses=net.num_addresses,
+        usable_hosts=usable,
+        ip_class=classify_network(net),
+    )
+
+
+def calculate_subnet(cidr):
+    """
+    Calculate subnet details for a network given in CIDR notation
+    (e.g. '192.168.1.0/24').
+
+    Returns: SubnetInfo, or None if the network is invalid (the error
+    is reported on every call, not just the first - only successful
+    results are cached)
+    """
+    try:
+        return _subnet_info(cidr)
+    except ValueError as ex:
+        print(f"❌ Invalid network: {ex}")
+        return None
+
+
+# Main program
+if __name__ == "__main__":
+    print("=== Subnet Calculator ===\n")
+
+    test_networks = ["192.168.1.0/24", "10.0.0.0/8", "172.16.5.37/28"]
+
+    for cidr in test_networks:
+        info = calculate_subnet(cidr)
+        if info is None:
+            continue
+
+        details = info.as_strings()
+        print(f"Network: {details['network']} (Class {details['class']})")
+        print(f"  Netmask:        {details['netmask']}")
+        print(f"  Wildcard:       {details['wildcard']}")
+        print(f"  Broadcast:      {details['broadcast']}")
+        print(f"  Usable range:   {details['first_usable']} - {details['last_usable']}")
+        print(f"  Total/usable:   {details['total_addresses']}/{details['usable_hosts']}\n")
@@ -1,7 +1,7 @@
 # main.py
 # Main script using modular security functions
 
-from utils import validate_ip, calculate_threat_score
+from utils import validate_ips_batch, calculate_threat_scores
 from file_ops import load_blocklist, save_report
 
 print("=== Modular IP Blocklist Checker ===\n")
@@ -13,18 +13,19 @@ if blocklist:
     print(f"Loaded blocklist: {blocklist['blocklist_name']}")
     print(f"Total blocked IPs: {len(blocklist['ips'])}\n")
 
+    entries = blocklist['ips']
+
+    # Validate, score and average in batch passes before the display
+    # loop, so the loop itself only formats
+    valid_flags = validate_ips_batch([entry['ip'] for entry in entries])
+    attacks = [entry['attacks'] for entry in entries]
+    scores = calculate_threat_scores(attacks, 'critical')  # all blocklist IPs are critical
+
     # Process each IP using utils module
-    for entry in blocklist['ips']:
+    for entry, is_valid, score in zip(entries, valid_flags, scores):
         ip = entry['ip']
 
-        # Validate IP using utils module
-        if validate_ip(ip):
-            # Calculate threat score
-            score = calculate_threat_score(
-                entry['attacks'],
-                'critical'  # All blocklist IPs are critical
-            )
-
+        if is_valid:
             print(f"✓ {ip}")
             print(f"  Reason: {entry['reason']}")
             print(f"  Attacks: {entry['attacks']}")
@@ -34,8 +35,8 @@ if blocklist:
 
     # Generate summary report using file_ops module
     summary = {
-        "total_blocked": len(blocklist['ips']),
-        "average_attacks": sum(e['attacks'] for e in blocklist['ips']) / len(blocklist['ips'])
+        "total_blocked": len(entries),
+        "average_attacks": sum(attacks) / len(attacks)
     }
 
     save_report('summary.json', summary)
@@ -3,6 +3,51 @@
 
 import json
 
+# orjson parses and serializes several times faster than stdlib json,
+# especially for indented output; fall back to stdlib when missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ijson (optional) streams individual array items out of a feed without
+# building the whole document, keeping memory flat on multi-GB feeds
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+def loads(text):
+    """Parse JSON text with the fastest available parser."""
+    return orjson.loads(text) if orjson is not None else json.loads(text)
+
+def dumps_pretty(obj):
+    """Serialize to 2-space-indented JSON text."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+def dumps_compact(obj):
+    """Serialize to compact JSON text (no pretty-print overhead)."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(',', ':'))
+
+# Module-scope frozenset: O(1) hashed membership test in the feed loop
+# instead of a linear scan of a list literal rebuilt per threat
+_HIGH_CRIT = frozenset({'high', 'critical'})
+
+def iter_threats(fp):
+    """Yield threats one at a time from a feed file object.
+
+    With ijson installed only the current threat is ever materialized;
+    otherwise the whole feed is parsed up front as before.
+    """
+    if ijson is not None:
+        yield from ijson.items(fp, 'threats.item')
+    else:
+        yield from loads(fp.read())['threats']
+
 # Simulate a threat intelligence feed (normally from API)
 threat_feed_json = '''
 {
@@ -38,7 +83,7 @@ threat_feed_json = '''
 print("=== Threat Intelligence Parser ===\n")
 
 # Parse JSON string to Python dict
-feed_data = json.loads(threat_feed_json)
+feed_data = loads(threat_feed_json)
 
 print(f"Feed: {feed_data['feed_name']}")
 print(f"Generated: {feed_data['generated']}")
@@ -47,40 +92,40 @@ print(f"Total Threats: {feed_data['total_threats']}\n")
 print("High-Severity Threats:")
 print("-" * 50)
 
-# Process each threat
-for threat in feed_data['threats']:
-    # Filter for high and critical severity
-    if threat['severity'] in ['high', 'critical']:
-        print(f"\n⚠️  {threat['severity'].upper()}")
-        print(f"   IP: {threat['ip']}")
-        print(f"   Type: {threat['type']}")
-        print(f"   Attacks: {threat['attacks_count']}")
-        print(f"   First Seen: {threat['first_seen']}")
-
-# Create blocklist from critical threats
+# Blocklist of critical threats, filled in the same pass that prints
 blocklist = {
     "blocklist_name": "Critical Threats",
     "generated": "2024-01-08",
     "ips": []
 }
 
+# One pass over the already-parsed threats handles both the display
+# filter and the blocklist build - no second walk over the list and no
+# re-parse; a caller streaming a real feed would hand iter_threats the
+# API response instead of parsing up front at all
 for threat in feed_data['threats']:
-    if threat['severity'] == 'critical':
+    severity = threat['severity']
+    if severity in _HIGH_CRIT:
+        print(f"\n⚠️  {severity.upper()}")
+        print(f"   IP: {threat['ip']}")
+        print(f"   Type: {threat['type']}")
+        print(f"   Attacks: {threat['attacks_count']}")
+        print(f"   First Seen: {threat['first_seen']}")
+    if severity == 'critical':
         blocklist['ips'].append({
             "ip": threat['ip'],
             "reason": threat['type'],
             "attacks": threat['attacks_count']
         })
 
-# Write blocklist to JSON file
+# Write blocklist to JSON file; compact separators skip the
+# pretty-printer entirely (consumers parse it, humans get the pretty
+# copy on stdout below)
 with open('blocklist.json', 'w') as f:
-    json.dump(blocklist, f, indent=2)
+    f.write(dumps_compact(blocklist))
 
 print("\n\nBlocklist generated: blocklist.json")
 
-# Read and display the blocklist
-with open('blocklist.json', 'r') as f:
-    saved_blocklist = json.load(f)
-
+# Display the blocklist we just built - no file round-trip needed
 print("\nBlocklist contents:")
-print(json.dumps(saved_blocklist, indent=2))
\ No newline at end of file
+print(dumps_pretty(blocklist))
\ No newline at end of file
@@ -1,10 +1,33 @@
 # evidence_backup.py
 # Create forensic-safe backups with metadata preservation
 
+import os
 import shutil
+import zipfile
 from pathlib import Path
 from datetime import datetime
 
+def fast_copy2(src, dst):
+    """copy2-equivalent that copies file data inside the kernel.
+
+    os.copy_file_range moves the bytes without bouncing them through
+    userspace buffers; shutil.copystat then preserves the metadata just
+    like copy2. Falls back to shutil.copy2 where the syscall is missing.
+    """
+    if not hasattr(os, 'copy_file_range'):
+        return shutil.copy2(src, dst)
+
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+        remaining = os.fstat(in_fd).st_size
+        while remaining > 0:
+            copied = os.copy_file_range(in_fd, out_fd, remaining)
+            if copied == 0:
+                break
+            remaining -= copied
+    shutil.copystat(src, dst)
+    return dst
+
 print("=== Forensic Evidence Backup Tool ===\n")
 
 # Create sample evidence file with specific timestamp
@@ -37,31 +60,45 @@ print("❌ BAD: Using shutil.copy()")
 print(f"   Backup modification time: {bad_mtime}")
 print(f"   Metadata LOST - timestamp shows backup time, not original!\n")
 
-# GOOD WAY - Using copy2 (preserves metadata)
+# GOOD WAY - Using fast_copy2 (preserves metadata, in-kernel copy)
 good_backup = backup_dir / 'evidence_copy_good.log'
-shutil.copy2(evidence_path, good_backup)
+fast_copy2(evidence_path, good_backup)
 
 good_stats = good_backup.stat()
 good_mtime = datetime.fromtimestamp(good_stats.st_mtime)
 
-print("✅ GOOD: Using shutil.copy2()")
+print("✅ GOOD: Using fast_copy2() (copy_file_range + copystat)")
 print(f"   Backup modification time: {good_mtime}")
 print(f"   Metadata PRESERVED - exact match to original!\n")
 
 # Create timestamped archive of evidence
 print("Creating forensic archive...")
 
+# ZIP_STORED: the evidence is preserved, not recompressed - log files
+# like these gain little from DEFLATE and skipping it removes all the
+# zlib CPU cost from the archive step
 archive_name = f"evidence_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-archive_path = shutil.make_archive(archive_name, 'zip', backup_dir)
+archive_path = f"{archive_name}.zip"
+with zipfile.ZipFile(archive_path, 'w', compression=zipfile.ZIP_STORED) as zf:
+    for item in sorted(backup_dir.rglob('*')):
+        if item.is_file():
+            zf.write(item, item.relative_to(backup_dir))
+
+# One stat() serves both prints; basename needs no syscall at all
+archive_st = os.stat(archive_path)
+archive_basename = os.path.basename(archive_path)
 
-print(f"✓ Archive created: {Path(archive_path).name}")
-print(f"  Size: {Path(archive_path).stat().st_size} bytes")
+print(f"✓ Archive created: {archive_basename}")
+print(f"  Size: {archive_st.st_size} bytes")
 
 # Move archive to secure storage
 secure_storage = Path('secure_storage')
 secure_storage.mkdir(exist_ok=True)
 
-final_location = shutil.move(archive_path, secure_storage / Path(archive_path).name)
+# os.replace is a pure rename here (same filesystem) - no data copy,
+# unlike shutil.move's copy-then-delete fallback machinery
+final_location = secure_storage / archive_basename
+os.replace(archive_path, final_location)
 
 print(f"\n✓ Archive moved to secure storage:")
 print(f"  {final_location}")
@@ -19,24 +19,31 @@ WARNING: Unusual network traffic pattern detected
 
 print(f"Processing: {log_file}\n")
 
-# Track findings by severity
+# Track findings by severity (bytes prefixes: the log is scanned
+# undecoded, so non-matching lines never pay for UTF-8 decoding)
+SEVERITIES = (b'CRITICAL', b'ERROR', b'WARNING')
+
 findings = {
     'WARNING': [],
     'ERROR': [],
     'CRITICAL': []
 }
 
-# Process log with line numbers
-with log_file.open('r') as f:
+# Process log with line numbers, streaming raw bytes through a large
+# buffer; lines are only decoded once they match a severity prefix
+with log_file.open('rb', buffering=1 << 20) as f:
     for line_num, line in enumerate(f, start=1):
         line = line.strip()
 
-        # Check for severity levels
-        for severity in findings.keys():
-            if line.startswith(severity):
-                findings[severity].append({
+        # Check for severity levels: startswith accepts a tuple and
+        # short-circuits in C, so this is one call per line instead of
+        # one Python loop iteration per severity
+        if line.startswith(SEVERITIES):
+            entries = findings.get(line.split(b':', 1)[0].decode('latin-1'))
+            if entries is not None:
+                entries.append({
                     'line': line_num,
-                    'message': line
+                    'message': line.decode('latin-1')
                 })
 
 # Display findings
@@ -25,12 +25,42 @@ import argparse
 import json
 import random
 from datetime import datetime
-from typing import Any, Dict, List, Tuple, Optional
+from typing import Any, Dict, Iterable, List, Tuple, Optional
+
+# orjson (optional) parses and serializes several times faster than the
+# stdlib, particularly for indented output; its JSONDecodeError is a
+# subclass of json.JSONDecodeError so the error paths below still work.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# ijson (optional) streams array items without materializing the whole
+# config, keeping memory flat on very large source lists.
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# numpy (optional) lets the simulator draw all of a source's file sizes
+# in one batch call instead of one Python-level RNG call per file.
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 # -----------------------------
 # Helpers
 # -----------------------------
 
+def json_loads(data: bytes) -> Any:
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+def json_dumps_pretty(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
 def iso_now() -> str:
     return datetime.now().isoformat(timespec="seconds")
 
@@ -47,8 +77,8 @@ def clamp(n: float, lo: float, hi: float) -> float:
 def load_config(filepath: str) -> Optional[Dict[str, Any]]:
     """Load and parse JSON file. Returns dict or None on error."""
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(filepath, "rb") as f:
+            return json_loads(f.read())
     except FileNotFoundError:
         print(f"Error: file not found: {filepath}")
         return None
@@ -59,10 +89,62 @@ def load_config(filepath: str) -> Optional[Dict[str, Any]]:
         print(f"Error: could not read config: {ex}")
         return None
 
+def iter_sources(filepath: str):
+    """Lazily yield the config's sources one at a time.
+
+    With ijson installed this never builds the full document, so memory
+    stays O(1 source) no matter how large the config grows; without it,
+    the sources come from a regular load_config. simulate_backup
+    consumes sources in a single pass, so callers working with huge
+    configs can feed it this iterator directly.
+    """
+    if ijson is not None:
+        with open(filepath, "rb") as f:
+            yield from ijson.items(f, "sources.item")
+    else:
+        cfg = load_config(filepath)
+        yield from (cfg or {}).get("sources", [])
+
 # --------------------------------
 # Part 3: Function: validate_config
 # --------------------------------
 
+# Declarative field schemas: key -> (type, type label, required,
+# must be non-empty after strip). One loop over a table replaces the
+# hand-written isinstance ladder that used to run per source.
+_SOURCE_SCHEMA = {
+    "path": (str, "string", True, True),
+    "name": (str, "string", False, False),
+    "recursive": (bool, "boolean", False, False),
+    "include_patterns": (list, "list", False, False),
+    "exclude_patterns": (list, "list", False, False),
+}
+
+_DESTINATION_SCHEMA = {
+    "base_path": (str, "string", True, True),
+    "create_timestamped_folders": (bool, "boolean", False, False),
+    "retention_days": ((int, float), "number", False, False),
+}
+
+_OPTIONS_SCHEMA = {
+    "verify_backups": (bool, "boolean", False, False),
+    "max_file_size_mb": ((int, float), "number", False, False),
+}
+
+def _check_field(obj: Dict[str, Any], key: str, spec, errs: List[str],
+                 *, qualname: str, missing_msg: str) -> None:
+    """Validate one field against its schema entry, appending errors."""
+    typ, label, required, not_empty = spec
+    if key not in obj:
+        if required:
+            errs.append(missing_msg)
+        return
+    val = obj[key]
+    if not isinstance(val, typ):
+        errs.append(f"{qualname} must be a {label}, got {type_name(val)}")
+    elif not_empty and val.strip() == "":
+        errs.append(f"{qualname} cannot be empty")
+
 def validate_config(cfg: Dict[str, Any]) -> Tuple[bool, List[str]]:
     """
     Validate configuration across 4 levels.
@@ -121,52 +203,24 @@ def validate_config(cfg: Dict[str, Any]) -> Tuple[bool, List[str]]:
                 if not isinstance(src, dict):
                     errors.append(f"Source {idx}: must be an object, got {type_name(src)}")
                     continue
-                # required: path
-                if "path" not in src:
-                    errors.append(f"Source {idx}: missing 'path' field")
-                else:
-                    if not isinstance(src["path"], str):
-                        errors.append(f"Source {idx}: 'path' must be a string, got {type_name(src['path'])}")
-                    elif src["path"].strip() == "":
-                        errors.append(f"Source {idx}: 'path' cannot be empty")
-
-                # optional: name
-                if "name" in src and not isinstance(src["name"], str):
-                    errors.append(f"Source {idx}: 'name' must be a string, got {type_name(src['name'])}")
-
-                # optional: recursive
-                if "recursive" in src and not isinstance(src["recursive"], bool):
-                    errors.append(f"Source {idx}: 'recursive' must be a boolean, got {type_name(src['recursive'])}")
-
-                # optional patterns: must be lists if present
-                if "include_patterns" in src and not isinstance(src["include_patterns"], list):
-                    errors.append(f"Source {idx}: 'include_patterns' must be a list, got {type_name(src['include_patterns'])}")
-                if "exclude_patterns" in src and not isinstance(src["exclude_patterns"], list):
-                    errors.append(f"Source {idx}: 'exclude_patterns' must be a list, got {type_name(src['exclude_patterns'])}")
+                for key, spec in _SOURCE_SCHEMA.items():
+                    _check_field(src, key, spec, errors,
+                                 qualname=f"Source {idx}: '{key}'",
+                                 missing_msg=f"Source {idx}: missing '{key}' field")
 
     # Destination fields
     if isinstance(destination, dict):
-        if "base_path" not in destination:
-            errors.append("Missing required field: 'destination.base_path'")
-        else:
-            bp = destination["base_path"]
-            if not isinstance(bp, str):
-                errors.append(f"'destination.base_path' must be a string, got {type_name(bp)}")
-            elif bp.strip() == "":
-                errors.append("'destination.base_path' cannot be empty")
-
-        if "create_timestamped_folders" in destination and not isinstance(destination["create_timestamped_folders"], bool):
-            errors.append(f"'destination.create_timestamped_folders' must be a boolean, got {type_name(destination['create_timestamped_folders'])}")
-
-        if "retention_days" in destination and not isinstance(destination["retention_days"], (int, float)):
-            errors.append(f"'destination.retention_days' must be a number, got {type_name(destination['retention_days'])}")
+        for key, spec in _DESTINATION_SCHEMA.items():
+            _check_field(destination, key, spec, errors,
+                         qualname=f"'destination.{key}'",
+                         missing_msg=f"Missing required field: 'destination.{key}'")
 
     # Options fields
     if isinstance(options, dict):
-        if "verify_backups" in options and not isinstance(options["verify_backups"], bool):
-            errors.append(f"'options.verify_backups' must be a boolean, got {type_name(options['verify_backups'])}")
-        if "max_file_size_mb" in options and not isinstance(options["max_file_size_mb"], (int, float)):
-            errors.append(f"'options.max_file_size_mb' must be a number, got {type_name(options['max_file_size_mb'])}")
+        for key, spec in _OPTIONS_SCHEMA.items():
+            _check_field(options, key, spec, errors,
+                         qualname=f"'options.{key}'",
+                         missing_msg=f"Missing required field: 'options.{key}'")
 
     return len(errors) == 0, errors
 
@@ -174,7 +228,8 @@ def validate_config(cfg: Dict[str, Any]) -> Tuple[bool, List[str]]:
 # Part 4: Function: simulate_backup
 # --------------------------------
 
-def _fake_name_from_pattern(source_name: str, pattern: str, i: int, when: str) -> str:
+def _fake_name_from_pattern(source_name: str, pattern: str, i: int, when: str,
+                            choice=random.choice) -> str:
     """Create a realistic filename from a glob-like pattern."""
     pattern = (pattern or "*").lower()
     date = when.split("T")[0]  # YYYY-MM-DD
@@ -189,24 +244,31 @@ def _fake_name_from_pattern(source_name: str, pattern: str, i: int, when: str) -
             f"{base}.log",
             f"{base}_{i}.log"
         ]
-        return random.choice(variants)
+        return choice(variants)
     if pattern.endswith(".txt") or "*.txt" in pattern:
-        return random.choice([f"readme_{i}.txt", f"summary_{date}.txt", f"notes_{i}.txt"])
+        return choice([f"readme_{i}.txt", f"summary_{date}.txt", f"notes_{i}.txt"])
     if pattern.endswith(".json") or "*.json" in pattern:
-        return random.choice([f"alerts_{date}.json", f"events_{i}.json", f"batch_{i:03d}.json"])
+        return choice([f"alerts_{date}.json", f"events_{i}.json", f"batch_{i:03d}.json"])
     if "auth.log" in pattern:
-        return random.choice(["auth.log", "auth.log.1", "auth.log.2", f"auth_{date}.log"])
+        return choice(["auth.log", "auth.log.1", "auth.log.2", f"auth_{date}.log"])
     if "*.gz" in pattern:
-        return random.choice([f"{source_name.lower().replace(' ','_')}_{i}.log.gz", f"archive_{date}.gz"])
+        return choice([f"{source_name.lower().replace(' ','_')}_{i}.log.gz", f"archive_{date}.gz"])
     # Default
     return f"{source_name.lower().replace(' ','_')}_{i}.dat"
 
-def simulate_backup(cfg: Dict[str, Any]) -> Dict[str, Any]:
+def simulate_backup(cfg: Dict[str, Any],
+                    sources: Optional[Iterable[Dict[str, Any]]] = None,
+                    seed: Optional[int] = None) -> Dict[str, Any]:
     """
     DRY-RUN: Generate FAKE operations. No filesystem I/O.
     - Creates 5–15 fake files per source
     - File sizes: 1–100 MB (or capped by options.max_file_size_mb)
     - Shows source → destination mapping
+    - 'sources' may override cfg['sources'] with any iterable (e.g. the
+      lazy iter_sources stream), consumed in a single pass
+    - 'seed' makes the simulation reproducible; with numpy installed a
+      source's file sizes come from one batch draw instead of a Python
+      RNG call per file
     """
     meta = cfg.get("metadata", {})
     plan_name = meta.get("plan_name") or cfg.get("plan_name") or "Unnamed Plan"
@@ -221,28 +283,51 @@ def simulate_backup(cfg: Dict[str, Any]) -> Dict[str, Any]:
     max_mb = float(opts.get("max_file_size_mb", 100))
     max_mb = clamp(max_mb, 1.0, 1000.0)  # sane cap
 
+    # Dedicated (seedable) RNG; never touches the global random state
+    if np is not None:
+        _rng = np.random.default_rng(seed)
+
+        def _choice(seq):
+            return seq[int(_rng.integers(len(seq)))]
+    else:
+        _rng = random.Random(seed)
+        _choice = _rng.choice
+
     operations = []
     total_files = 0
     total_size_mb = 0.0
 
-    for src in cfg.get("sources", []):
+    if sources is None:
+        sources = cfg.get("sources", [])
+
+    for src in sources:
         src_name = src.get("name") or src.get("path", "unknown")
         include = src.get("include_patterns") or ["*"]
         exclude = src.get("exclude_patterns") or []  # not applied in fake mode, but kept for show
 
-        # Files per source
-        n_files = random.randint(5, 15)
-        files = []
-        for i in range(1, n_files + 1):
-            pat = random.choice(include)
-            fname = _fake_name_from_pattern(src_name, pat, i, timestamp)
-            size = round(random.uniform(1.0, max_mb), 1)  # MB
-            files.append({"name": fname, "size_mb": size})
+        # Files per source: sizes drawn in one batch when numpy is
+        # available, otherwise one draw per file
+        if np is not None:
+            n_files = int(_rng.integers(5, 16))
+            sizes = np.round(_rng.uniform(1.0, max_mb, size=n_files), 1)
+            src_total = round(float(sizes.sum()), 1)
+            sizes = [float(s) for s in sizes]
+        else:
+            n_files = _rng.randint(5, 15)
+            sizes = [round(_rng.uniform(1.0, max_mb), 1) for _ in range(n_files)]
+            src_total = round(sum(sizes), 1)
 
-        src_total = round(sum(f["size_mb"] for f in files), 1)
-        total_files += len(files)
+        total_files += n_files
         total_size_mb += src_total
 
+        # Dicts are only built after the arithmetic is done on the raw
+        # sizes; the full list still goes into the JSON report
+        files = []
+        for i, size in enumerate(sizes, start=1):
+            pat = _choice(include)
+            fname = _fake_name_from_pattern(src_name, pat, i, timestamp, choice=_choice)
+            files.append({"name": fname, "size_mb": size})
+
         dest_path = f"{base_path}/{plan_name.replace(' ', '_')}/{src_name.replace(' ', '_')}"
         if use_ts:
             dest_path = f"{dest_path}/{ts_folder}"
@@ -267,7 +352,7 @@ def simulate_backup(cfg: Dict[str, Any]) -> Dict[str, Any]:
         "mode": "DRY-RUN",
         "timestamp": timestamp,
         "summary": {
-            "total_sources": len(cfg.get("sources", [])),
+            "total_sources": len(operations),
             "total_files": total_files,
             "total_size_mb": round(total_size_mb, 1)
         },
@@ -279,32 +364,34 @@ def simulate_backup(cfg: Dict[str, Any]) -> Dict[str, Any]:
 # Part 3: Function: generate_report
 # --------------------------------
 
-def generate_report(report: Dict[str, Any]) -> str:
-    lines: List[str] = []
-    lines.append(f"Backup Plan Report — {report['plan_name']}")
-    lines.append(f"Mode: {report['mode']}   Time: {report['timestamp']}")
-    lines.append("-" * 70)
+def _report_lines(report: Dict[str, Any]) -> Iterable[str]:
+    """Yield the report lines; "\\n".join consumes them without ever
+    holding an intermediate list."""
+    yield f"Backup Plan Report — {report['plan_name']}"
+    yield f"Mode: {report['mode']}   Time: {report['timestamp']}"
+    yield "-" * 70
     s = report["summary"]
-    lines.append(f"Sources: {s['total_sources']} | Files: {s['total_files']} | Size: {s['total_size_mb']} MB")
-    lines.append("")
+    yield f"Sources: {s['total_sources']} | Files: {s['total_files']} | Size: {s['total_size_mb']} MB"
+    yield ""
 
     for op in report["operations"]:
-        lines.append(f"[{op['source_name']}]")
-        lines.append(f"  From: {op['source_path']}")
-        lines.append(f"  To:   {op['destination_path']}")
-        lines.append(f"  Files: {op['source_summary']['count']}  |  Size: {op['source_summary']['total_size_mb']} MB")
-        lines.append(f"  Include: {op['patterns_used']['include']}")
+        yield f"[{op['source_name']}]"
+        yield f"  From: {op['source_path']}"
+        yield f"  To:   {op['destination_path']}"
+        yield f"  Files: {op['source_summary']['count']}  |  Size: {op['source_summary']['total_size_mb']} MB"
+        yield f"  Include: {op['patterns_used']['include']}"
         if op['patterns_used']['exclude']:
-            lines.append(f"  Exclude: {op['patterns_used']['exclude']}")
+            yield f"  Exclude: {op['patterns_used']['exclude']}"
         # Show up to 5 sample files
         sample = op["files"][:5]
         if sample:
-            lines.append("  Sample files:")
+            yield "  Sample files:"
             for f in sample:
-                lines.append(f"    • {f['name']}  ({f['size_mb']} MB)")
-        lines.append("")
+                yield f"    • {f['name']}  ({f['size_mb']} MB)"
+        yield ""
 
-    return "\n".join(lines)
+def generate_report(report: Dict[str, Any]) -> str:
+    return "\n".join(_report_lines(report))
 
 # -----------------------------
 # Part 3: Function: main
@@ -315,6 +402,7 @@ def main(argv: Optional[List[str]] = None) -> int:
     parser.add_argument("--config", required=True, help="Path to JSON configuration file")
     parser.add_argument("--dry-run", action="store_true", help="Simulate only (default behavior)")
     parser.add_argument("--json-out", help="Optional path to write JSON report")
+    parser.add_argument("--seed", type=int, help="Seed the simulation for reproducible output")
     args = parser.parse_args(argv)
 
     cfg = load_config(args.config)
@@ -328,13 +416,13 @@ def main(argv: Optional[List[str]] = None) -> int:
             print(f" - {e}")
         return 2
 
-    report = simulate_backup(cfg)
+    report = simulate_backup(cfg, seed=args.seed)
     print(generate_report(report))
 
     if args.json_out:
         try:
-            with open(args.json_out, "w", encoding="utf-8") as f:
-                json.dump(report, f, indent=2)
+            with open(args.json_out, "wb") as f:
+                f.write(json_dumps_pretty(report))
             print(f"(JSON written to {args.json_out})")
         except Exception as ex:
             print(f"Warning: could not write JSON report: {ex}")